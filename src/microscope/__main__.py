@@ -0,0 +1,7 @@
+# src/microscope/__main__.py
+"""Allows the application to be started with `python -m microscope`."""
+
+from microscope.main import main
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 # src/microscope/acquisition/__init__.py
 from .engine import PLogicMDAEngine
-from .worker import AcquisitionWorker
+from .worker import AcquisitionThread
 
-__all__ = ["PLogicMDAEngine", "AcquisitionWorker"]
+__all__ = ["PLogicMDAEngine", "AcquisitionThread"]
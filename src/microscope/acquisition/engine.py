@@ -4,22 +4,30 @@ Manages the acquisition lifecycle, frame buffering, and scrubbing.
 """
 
 import logging
+import os
+import shutil
+import tempfile
+from contextlib import ExitStack
+from pathlib import Path
 
+import numpy as np
 from pymmcore_plus import CMMCorePlus
 from pymmcore_plus.mda import MDAEngine
-from qtpy.QtCore import QMetaObject, Qt, QThread
+from qtpy.QtCore import Qt, QThread
 from useq import (
     AnyTimePlan,
     AnyZPlan,
     MDAEvent,
     MDASequence,
     MultiPhaseTimePlan,
+    TDurationLoops,
+    TIntervalDuration,
     TIntervalLoops,
     ZAboveBelow,
     ZRangeAround,
 )
 
-from microscope.acquisition.worker import AcquisitionWorker
+from microscope.acquisition.worker import AcquisitionThread, buffer_slots
 from microscope.hardware import (
     configure_galvo_for_spim_scan,
     configure_plogic_for_dual_nrt_pulses,
@@ -27,12 +35,14 @@ from microscope.hardware import (
     send_tiger_command,
     set_camera_for_hardware_trigger,
     set_property,
-    trigger_spim_scan_acquisition,
 )
 from microscope.model.hardware_model import HardwareConstants
 
 logger = logging.getLogger(__name__)
 
+# Z-plans defined by a step size, whose step and range are read from their fields.
+_Z_STEP_TYPES = (ZRangeAround, ZAboveBelow)
+
 
 class PLogicMDAEngine(MDAEngine):
     """Custom MDA engine for PLogic-driven SPIM Z-stacks."""
@@ -41,17 +51,35 @@ class PLogicMDAEngine(MDAEngine):
         super().__init__(mmc)
         self._mmc = mmc
         self.HW = hw_constants
-        self._worker: AcquisitionWorker | None = None
-        self._thread: QThread | None = None
-        self._frame_buffer: dict = {}
+        self._thread: AcquisitionThread | None = None
+        # Logical (t, p, z, c) extent of the scrub buffer.
+        self._buffer_shape: tuple[int, int, int, int] = (0, 0, 0, 0)
+        # Events and metadata in parallel flat arrays addressed by _flat_index.
+        self._events: np.ndarray = np.empty(0, dtype=object)
+        self._metas: np.ndarray = np.empty(0, dtype=object)
+        # Pixels for the same flat slots, spilled to a disk-backed memmap
+        # so that scrubbing does not pin every frame in RAM.
+        self._pixel_store: np.memmap | None = None
+        # Frames are only kept for scrubbing when a viewer can use them.
+        self.scrubbing_enabled: bool = hw_constants.enable_scrubbing
         self._sequence: MDASequence | None = None
-        self._original_autoshutter: bool = False
+        # Z positions of the current sequence, enumerated once per run.
+        self._z_positions: list[float] = []
+        # Bound once; the runner's signal group lives as long as the core.
+        self._emit_frame = mmc.mda.events.frameReady.emit
+        # Restore steps for the hardware changed by the current sequence, pushed
+        # just before each change so cleanup only undoes what setup touched.
+        self._cleanup_stack = ExitStack()
 
     def run(self, sequence: MDASequence) -> None:
         """Run an MDA sequence, handling setup, execution, and cleanup."""
-        self._frame_buffer.clear()
+        self._buffer_shape = (0, 0, 0, 0)
+        self._events = np.empty(0, dtype=object)
+        self._metas = np.empty(0, dtype=object)
+        self._pixel_store = None
         self._sequence = sequence
-        self._original_autoshutter = self._mmc.getAutoShutter()
+        self._z_positions = self._enumerate_z_positions(sequence.z_plan)
+        self._cleanup_stack = ExitStack()
 
         if self._should_use_plogic(sequence):
             logger.info("Running custom PLogic Z-stack sequence")
@@ -62,37 +90,25 @@ class PLogicMDAEngine(MDAEngine):
                 self._cleanup_hardware(sequence)
                 return
 
-            # The total number of images is simply the total length of the sequence iterable
-            total_images = len(list(sequence))
-
-            self._worker = AcquisitionWorker(self._mmc, sequence, self.HW, total_images)
-            self._thread = QThread()
-            self._worker.moveToThread(self._thread)
-
-            self._worker.frameReady.connect(self._on_frame_ready, Qt.ConnectionType.QueuedConnection)
-            self._worker.acquisitionFinished.connect(self._on_acquisition_finished, Qt.ConnectionType.QueuedConnection)
-            self._thread.started.connect(self._start_worker_and_hardware)
-
-            self._thread.start()
+            self._thread = AcquisitionThread(self._mmc, sequence, self.HW, self._buffer_shape)
+            self._thread.framesReady.connect(self._on_frames_ready, Qt.ConnectionType.QueuedConnection)
+            self._thread.acquisitionFinished.connect(self._on_acquisition_finished, Qt.ConnectionType.QueuedConnection)
+            # The thread must drain the camera buffer promptly; ask the OS not to starve it.
+            self._thread.start(QThread.Priority.TimeCriticalPriority)
         else:
             logger.info("Falling back to default MDA engine")
             self._mmc.run_mda(sequence)
 
-    def _start_worker_and_hardware(self):
-        """Trigger hardware from the main thread, then start the worker's loop."""
-        if not self._worker:
-            return
-
-        # These calls now safely execute in the main thread.
-        self._mmc.startSequenceAcquisition(self.HW.camera_a_label, self._worker.total_images, 0, True)
-        trigger_spim_scan_acquisition(self._mmc, self.HW)
+    def cancel(self) -> None:
+        """Stop a running hardware-timed acquisition; cleanup follows as usual."""
+        if self._thread and self._thread.isRunning():
+            self._thread.stop()
 
-        # Asynchronously invoke the worker's run method in its own thread.
-        QMetaObject.invokeMethod(
-            self._worker,
-            b"run",  # Method name must be bytes
-            Qt.ConnectionType.QueuedConnection,
-        )
+    def wait_for_acquisition(self, timeout_ms: int) -> bool:
+        """Block until the acquisition thread exits; False if it is still running after the timeout."""
+        if self._thread is None:
+            return True
+        return self._thread.wait(timeout_ms)
 
     def _should_use_plogic(self, sequence: MDASequence) -> bool:
         """Check if the Core Focus device is the designated Piezo stage."""
@@ -105,9 +121,11 @@ class PLogicMDAEngine(MDAEngine):
 
     def _setup_hardware(self, sequence: MDASequence) -> bool:
         """Configure all hardware for the sequence. Runs in the main thread."""
-        try:
-            num_z = sequence.shape[sequence.axis_order.index("z")]
-        except ValueError:
+        # `sizes` maps every axis to its length (0 when unused), so each count is
+        # one lookup. `shape` drops unused axes and cannot be indexed by axis_order.
+        sizes = sequence.sizes
+        num_z = sizes.get("z", 0)
+        if not num_z:
             logger.error("Sequence must have a 'z' axis for PLogic acquisition.")
             return False
 
@@ -117,12 +135,19 @@ class PLogicMDAEngine(MDAEngine):
             return False
 
         # A T-plan is optional; if not present, we default to a single time point.
-        try:
-            num_t = sequence.shape[sequence.axis_order.index("t")]
-        except ValueError:
+        num_t = sizes.get("t", 0)
+        if not num_t:
             logger.info("No 't' axis found in sequence, defaulting to a single timepoint.")
             num_t = 1
 
+        # Positions and channels default to a single entry when unused.
+        num_p = sizes.get("p") or 1
+        num_c = sizes.get("c") or 1
+        self._buffer_shape = (num_t, num_p, num_z, num_c)
+        num_slots = num_t * num_p * num_z * num_c
+        self._events = np.empty(num_slots, dtype=object)
+        self._metas = np.empty(num_slots, dtype=object)
+
         # Get exposure from the MDA sequence; fall back to the core setting if not specified.
         exposure_ms = self._mmc.getExposure()
         if sequence.channels and sequence.channels[0].exposure is not None:
@@ -133,15 +158,34 @@ class PLogicMDAEngine(MDAEngine):
         scan_duration_s = (num_z * exposure_ms) / 1000.0
         repeat_delay_ms = max(0, (interval_s - scan_duration_s) * 1000.0)
 
-        total_images = len(list(sequence))
         logger.info(
-            "Starting hardware-timed series: %d images planned (%d timepoints, %d z-slices).",
-            total_images,
+            "Starting hardware-timed series: %d timepoints, %d z-slices.",
             num_t,
             num_z,
         )
 
-        if not set_camera_for_hardware_trigger(self._mmc, self.HW.camera_a_label):
+        stack = self._cleanup_stack
+        # Make the triggered camera the Core camera for the run, so frame metadata
+        # and the image-format queries for the pixel store describe it.
+        camera = self.HW.camera_a_label
+        try:
+            core_camera = self._mmc.getCameraDevice()
+            if core_camera != camera:
+                self._mmc.setCameraDevice(camera)
+                stack.callback(self._mmc.setCameraDevice, core_camera)
+        except Exception as e:
+            logger.error("Could not select camera '%s' for the sequence: %s", camera, e)
+            return False
+
+        # Reserve the spill file before any frame arrives; on a slow filesystem
+        # this can take seconds and must not stall the GUI thread mid-stream.
+        if self.scrubbing_enabled:
+            self._pixel_store = self._create_pixel_store()
+            if self._pixel_store is None:
+                return False
+
+        stack.callback(set_property, self._mmc, camera, "TriggerMode", "Internal Trigger")
+        if not set_camera_for_hardware_trigger(self._mmc, camera):
             return False
 
         # Update the existing AcquisitionSettings object from the hardware model
@@ -152,23 +196,23 @@ class PLogicMDAEngine(MDAEngine):
         settings.camera_exposure_ms = exposure_ms
         settings.laser_trig_duration_ms = exposure_ms  # Ensure laser pulse matches camera
 
+        # Reset the PLogic card to its idle preset so that snap/live
+        # can function correctly after the MDA.
+        stack.callback(disable_live_laser, self._mmc, self.HW)
         configure_plogic_for_dual_nrt_pulses(self._mmc, settings, self.HW)
 
         # Calculate galvo amplitude and update the settings object.
         # The default is loaded from the config file.
-        try:
-            z_positions = list(z_plan)
-            if len(z_positions) > 1:
-                z_range = max(z_positions) - min(z_positions)
-                settings.galvo_amplitude_deg = z_range / self.HW.slice_calibration_slope_um_per_deg
-                logger.info(
-                    "Calculated galvo amplitude of %.4f deg for a Z-range of %.2f um.",
-                    settings.galvo_amplitude_deg,
-                    z_range,
-                )
-        except TypeError:
-            logger.warning("Z-plan is not iterable, cannot calculate galvo amplitude from range.")
-
+        if num_z > 1:
+            z_range = self._z_range_um(z_plan, num_z)
+            settings.galvo_amplitude_deg = z_range / self.HW.slice_calibration_slope_um_per_deg
+            logger.info(
+                "Calculated galvo amplitude of %.4f deg for a Z-range of %.2f um.",
+                settings.galvo_amplitude_deg,
+                z_range,
+            )
+
+        stack.callback(set_property, self._mmc, self.HW.galvo_a_label, "SPIMState", "Idle")
         configure_galvo_for_spim_scan(
             self._mmc,
             settings,
@@ -176,60 +220,166 @@ class PLogicMDAEngine(MDAEngine):
             repeat_delay_ms=repeat_delay_ms,
             hw=self.HW,
         )
+        # Return PLogic to its internal 4kHz clock afterwards.
+        stack.callback(send_tiger_command, self._mmc, "PM E=0", self.HW)
         send_tiger_command(self._mmc, "PM E=1", self.HW)
         return True
 
-    def _on_frame_ready(self, frame: object, event: MDAEvent, meta: dict) -> None:
-        """Slot to handle the frameReady signal from the worker."""
-        key = tuple(event.index.get(k, 0) for k in ("t", "p", "z", "c"))
-        self._frame_buffer[key] = (frame, event, meta)
-        self._mmc.mda.events.frameReady.emit(frame, event, meta)
+    def _flat_index(self, t: int, p: int, z: int, c: int) -> int:
+        """Flat buffer slot for a (t, p, z, c) index, or -1 if it is out of range."""
+        return int(buffer_slots(np.array([(t, p, z, c)]), self._buffer_shape)[0])
+
+    def _on_frames_ready(self, batch: list[tuple[np.ndarray, MDAEvent, dict, int]]) -> None:
+        """Slot to handle the framesReady signal from the acquisition thread."""
+        scrubbing = self.scrubbing_enabled
+        emit_frame = self._emit_frame
+        # Downstream subscribers still receive one frameReady per frame, in order.
+        for frame, event, meta, slot in batch:
+            if scrubbing:
+                self._buffer_frame(frame, event, meta, slot)
+            emit_frame(frame, event, meta)
+
+    def _buffer_frame(self, frame: np.ndarray, event: MDAEvent, meta: dict, slot: int) -> None:
+        """Keep a frame and its metadata so it can be scrubbed back to later."""
+        if slot < 0:
+            logger.warning("Could not buffer frame %s for scrubbing: index out of range.", dict(event.index))
+            return
+        if self._pixel_store is None:
+            # Scrubbing was enabled after setup; this sequence has no store.
+            return
+        try:
+            self._pixel_store[slot] = frame
+            self._events[slot] = event
+            self._metas[slot] = meta
+        except ValueError as e:
+            logger.warning("Could not buffer frame %s for scrubbing: %s", dict(event.index), e)
+
+    def _create_pixel_store(self) -> np.memmap | None:
+        """
+        Allocate a disk-backed pixel array with one frame per buffer slot.
+
+        The frame shape and dtype come from the Core camera, which setup has
+        already pointed at the triggered camera.
+
+        Returns None if the spill directory lacks the space or the file
+        cannot be reserved.
+        """
+        dtype = np.dtype(f"uint{8 * self._mmc.getBytesPerPixel()}")
+        shape = self._events.shape + (self._mmc.getImageHeight(), self._mmc.getImageWidth())
+        nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        spill_dir = Path(self.HW.scrub_spill_dir or Path.home() / ".cache" / "microscope-control")
+        try:
+            spill_dir.mkdir(parents=True, exist_ok=True)
+            free = shutil.disk_usage(spill_dir).free
+        except OSError as e:
+            logger.error("Scrub spill directory %s is unusable: %s", spill_dir, e)
+            return None
+        if free < nbytes:
+            logger.error(
+                "Scrub pixel store needs %.1f GiB but only %.1f GiB is free in %s.",
+                nbytes / 2**30,
+                free / 2**30,
+                spill_dir,
+            )
+            return None
+
+        logger.debug("Allocating scrub pixel store of shape %s (%s) in %s.", shape, dtype, spill_dir)
+        # The anonymous temp file is removed by the OS once the memmap is released.
+        spill_file = tempfile.TemporaryFile(dir=spill_dir)
+        try:
+            if hasattr(os, "posix_fallocate"):
+                # Reserve the blocks up front: writing through the mapping into an
+                # unbacked page on a full disk kills the process with SIGBUS.
+                os.posix_fallocate(spill_file.fileno(), 0, nbytes)
+            return np.memmap(spill_file, dtype=dtype, mode="w+", shape=shape)
+        except OSError as e:
+            spill_file.close()
+            logger.error("Could not reserve %.1f GiB for the scrub pixel store: %s", nbytes / 2**30, e)
+            return None
 
     def set_displayed_slice(self, t: int, z: int) -> None:
         """Request a specific t- and z-slice to be displayed."""
-        lookup_key = (t, 0, z, 0)
-        if lookup_key in self._frame_buffer:
-            frame, event, meta = self._frame_buffer[lookup_key]
-            self._mmc.mda.events.frameReady.emit(frame, event, meta)
+        slot = self._flat_index(t, 0, z, 0)
+        if slot < 0:
+            return
+        event = self._events[slot]
+        if event is not None and self._pixel_store is not None:
+            meta = self._metas[slot]
+            # A view into the memmap; the OS page cache keeps recently viewed frames hot.
+            self._emit_frame(self._pixel_store[slot], event, meta)
 
     def _cleanup_hardware(self, sequence: MDASequence) -> None:
         """Resets hardware to a safe, idle state after acquisition."""
         logger.info("Cleaning up hardware state...")
-        # Set PLogic to use its internal 4kHz clock
-        send_tiger_command(self._mmc, "PM E=0", self.HW)
-        set_property(self._mmc, self.HW.camera_a_label, "TriggerMode", "Internal Trigger")
-        set_property(self._mmc, self.HW.galvo_a_label, "SPIMState", "Idle")
-        # FIX: Reset the PLogic card to its idle preset so that snap/live
-        # can function correctly after the MDA.
-        logger.debug("Resetting PLogic card to idle mode.")
-        disable_live_laser(self._mmc, self.HW)
+        # Stop the camera first so the restore writes below are not
+        # interleaved with a still-running sequence acquisition. This also
+        # covers a camera left running by a trigger that failed mid-arm.
+        camera = self.HW.camera_a_label
+        if self._mmc.isSequenceRunning(camera):
+            self._mmc.stopSequenceAcquisition(camera)
+
+        # Undo the setup steps that actually ran, most recent first.
+        try:
+            self._cleanup_stack.close()
+        except Exception as e:
+            logger.error("Hardware restore step failed during cleanup: %s", e)
+
+        # A single wait once all restore commands have been issued.
+        try:
+            self._mmc.waitForSystem()
+        except Exception as e:
+            logger.warning("Timed out waiting for devices during cleanup: %s", e)
         self._mmc.mda.events.sequenceFinished.emit(sequence)
 
     def _on_acquisition_finished(self, sequence: MDASequence) -> None:
-        """Slot to handle the acquisitionFinished signal from the worker."""
+        """Slot to handle the acquisitionFinished signal from the acquisition thread."""
         if self._thread:
-            self._thread.quit()
+            # run() has already returned or is about to; there is no event loop to quit.
             self._thread.wait()
         self._thread = None
-        self._worker = None
         self._cleanup_hardware(sequence)
 
+    @staticmethod
+    def _enumerate_z_positions(z_plan: AnyZPlan | None) -> list[float]:
+        """Materialize a Z-plan's positions once so helpers can share them."""
+        # Step and range of these plans are derived from their fields instead.
+        if not z_plan or isinstance(z_plan, _Z_STEP_TYPES):
+            return []
+        try:
+            return list(z_plan)
+        except TypeError:
+            logger.warning("Z-plan is not iterable, cannot derive step size or range from it.")
+            return []
+
     def _get_z_step_size(self, z_plan: AnyZPlan) -> float:
         """Safely get the Z-step size from any Z-plan object."""
-        if isinstance(z_plan, ZRangeAround | ZAboveBelow):
+        if isinstance(z_plan, _Z_STEP_TYPES):
             return z_plan.step
-        try:
-            z_positions = list(z_plan)
-            if len(z_positions) > 1:
-                return abs(z_positions[1] - z_positions[0])
-        except TypeError:
-            pass
+        z_positions = self._z_positions
+        if len(z_positions) > 1:
+            return abs(z_positions[1] - z_positions[0])
+        return 0.0
+
+    def _z_range_um(self, z_plan: AnyZPlan, num_z: int) -> float:
+        """Distance between the first and last slice of any Z-plan object."""
+        if isinstance(z_plan, _Z_STEP_TYPES):
+            # The slices actually taken span (num_z - 1) steps; `range` or
+            # `above + below` can differ from it when not a multiple of the step.
+            return (num_z - 1) * z_plan.step
+        z_positions = self._z_positions
+        if len(z_positions) > 1:
+            return max(z_positions) - min(z_positions)
         return 0.0
 
     def _get_time_interval_s(self, time_plan: AnyTimePlan | None) -> float:
         """Safely get the time interval in seconds from any TimePlan object."""
-        if isinstance(time_plan, TIntervalLoops):
-            return time_plan.interval.total_seconds()
-        if isinstance(time_plan, MultiPhaseTimePlan) and time_plan.phases:
-            return self._get_time_interval_s(time_plan.phases[0])
+        # Read the interval from the plan's fields; never iterate its timepoints.
+        match time_plan:
+            case TIntervalLoops(interval=interval) | TIntervalDuration(interval=interval):
+                return interval.total_seconds()
+            case TDurationLoops(loops=loops) if loops > 1:
+                # The interval is duration / (loops - 1), undefined for a single loop.
+                return time_plan.interval.total_seconds()
+            case MultiPhaseTimePlan(phases=[first_phase, *_]):
+                return self._get_time_interval_s(first_phase)
         return 0.0
@@ -1,28 +1,89 @@
 # src/microscope/acquisition/worker.py
 """
-Worker for running the hardware-timed collection loop of an MDA.
-Runs in a separate thread and emits frames as they are collected.
+Thread for running the hardware-timed collection loop of an MDA.
+The loop runs directly in QThread.run and emits frames as they are collected.
 """
 
 import logging
+import os
+import sys
+import threading
 import time
 
+import numpy as np
 from pymmcore_plus import CMMCorePlus
 from pymmcore_plus.metadata import frame_metadata
-from qtpy.QtCore import QObject, Signal, Slot  # type: ignore
+from qtpy.QtCore import QThread, Signal  # type: ignore
 from useq import MDAEvent, MDASequence
 
+from microscope.hardware import trigger_spim_scan_acquisition
 from microscope.model.hardware_model import HardwareConstants
 
 logger = logging.getLogger(__name__)
 
+# Empty-buffer polls that only yield the GIL before falling back to timed sleeps.
+_SPIN_POLLS = 8
+# Upper bound on one backoff sleep, so stop requests stay responsive on long exposures.
+_MAX_BACKOFF_S = 0.01
 
-class AcquisitionWorker(QObject):
+# Pinning is opt-in so default deployments keep the OS scheduler's thread placement.
+PIN_THREAD_ENV_VAR = "MICROSCOPE_PIN_ACQUISITION_THREAD"
+
+
+def _pin_current_thread(cpu_core: int) -> None:
+    """Pin the calling thread to one CPU on Linux, if enabled via the environment."""
+    if not sys.platform.startswith("linux") or not os.environ.get(PIN_THREAD_ENV_VAR):
+        return
+    try:
+        # On Linux, pid 0 addresses the calling thread rather than the whole process.
+        os.sched_setaffinity(0, {cpu_core})
+        logger.info("Pinned acquisition thread to CPU %d.", cpu_core)
+    except (OSError, ValueError) as e:
+        logger.warning("Could not pin acquisition thread to CPU %d: %s", cpu_core, e)
+
+
+def buffer_slots(coords: np.ndarray, buffer_shape: tuple[int, int, int, int]) -> np.ndarray:
+    """
+    Flat scrub-buffer slots for (t, p, z, c) indices.
+
+    This is the single definition of the buffer layout, shared by the
+    acquisition thread and the engine's scrub lookups.
+
+    Args:
+        coords: An (N, 4) integer array of (t, p, z, c) indices.
+        buffer_shape: The engine's (t, p, z, c) buffer extent.
+
+    Returns:
+        One slot per row, or -1 where an index falls outside the buffer.
+    """
+    coords = np.asarray(coords, dtype=np.int64).reshape(-1, 4)
+    slots = np.full(len(coords), -1, dtype=np.int64)
+    in_range = np.all((coords >= 0) & (coords < np.asarray(buffer_shape)), axis=1)
+    if in_range.any():
+        slots[in_range] = np.ravel_multi_index(tuple(coords[in_range].T), buffer_shape)
+    return slots
+
+
+def _event_slots(events: list[MDAEvent], buffer_shape: tuple[int, int, int, int]) -> list[int]:
+    """Flat scrub-buffer slot for each event, in acquisition order."""
+    coords = [[e.index.get(axis, 0) for axis in "tpzc"] for e in events]
+    return buffer_slots(np.array(coords), buffer_shape).tolist()
+
+
+class AcquisitionThread(QThread):
     """
-    Worker object for running the hardware-timed acquisition loop.
+    Thread running the hardware-timed acquisition loop.
+
+    The loop is executed directly from ``run()`` without an event loop;
+    signals are only used to deliver frames and the finished notification.
+    Frames drained in one wakeup are delivered together in a single emit.
+    The camera is armed and the scan triggered from ``run()`` as well, so the
+    blocking driver and serial calls never run on the GUI thread.
     """
 
-    frameReady = Signal(object, MDAEvent, dict)
+    # A list of (frame, event, meta, slot) tuples; slot is the frame's flat
+    # scrub-buffer index, or -1 if it has none.
+    framesReady = Signal(list)
     acquisitionFinished = Signal(MDASequence)
 
     def __init__(
@@ -30,59 +91,117 @@ class AcquisitionWorker(QObject):
         mmc: CMMCorePlus,
         sequence: MDASequence,
         hw_constants: HardwareConstants,
-        total_images: int,
+        buffer_shape: tuple[int, int, int, int],
         parent=None,
     ):
         super().__init__(parent)
         self._mmc = mmc
         self.sequence = sequence
         self.hw = hw_constants
-        self.total_images = total_images
+        # Set from the materialized events in run(); sizes overcount sequences
+        # that skip events (e.g. channels without a stack, acquire_every).
+        self.total_images = 0
+        self.buffer_shape = buffer_shape
         self._running = True
+        # Images arrive about once per exposure; poll a few times per frame when idle.
+        self._backoff_s = min(hw_constants.acquisition.camera_exposure_ms / 4 / 1000.0, _MAX_BACKOFF_S)
+        # Backoff sleeps wait on this, so a stop request wakes the loop at once.
+        self._wake = threading.Event()
 
     def stop(self) -> None:
         """Flags the acquisition to stop gracefully."""
-        logger.info("Stop requested for acquisition worker.")
+        logger.info("Stop requested for acquisition thread.")
         self._running = False
+        self._wake.set()
+
+    def _wait_for_images(self) -> int:
+        """
+        Wait until the circular buffer holds images.
+
+        Yields for the first few empty polls, then sleeps a fraction of the
+        exposure between polls, cut short by a stop request. The camera's
+        running state is only checked once polls have started sleeping.
+
+        Returns:
+            The number of images waiting, or 0 if the camera sequence stopped
+            with the buffer empty or a stop was requested.
+        """
+        idle_polls = 0
+        while self._running:
+            remaining = self._mmc.getRemainingImageCount()
+            if remaining:
+                return remaining
+            idle_polls += 1
+            if idle_polls <= _SPIN_POLLS:
+                time.sleep(0)
+                continue
+            if not self._mmc.isSequenceRunning(self.hw.camera_a_label):
+                # Images can land between the count and the running check.
+                return self._mmc.getRemainingImageCount()
+            self._wake.wait(self._backoff_s)
+        return 0
 
-    @Slot()
     def run(self) -> None:
         """
-        Executes the image collection loop for a hardware-timed sequence.
-        Assumes hardware has already been configured and started by the engine.
+        Arms the camera, triggers the scan and runs the image collection loop.
+        Assumes hardware has already been configured by the engine.
         """
         try:
-            logger.info("Acquisition worker now polling for frames.")
-
+            _pin_current_thread(self.hw.acquisition_cpu_core)
+            # Build every event before the camera is armed, so no pydantic
+            # models are constructed while frames are arriving.
             sequence = self.sequence.model_copy(update={"axis_order": ("t", "p", "z", "c")})
-            events = iter(sequence)
-
-            for _ in range(self.total_images):
+            event_list = list(sequence)
+            self.total_images = len(event_list)
+            slots = iter(_event_slots(event_list, self.buffer_shape))
+            events = iter(event_list)
+            # Camera, exposure and pixel size are fixed for a hardware-timed run,
+            # so query them once and only attach the event per frame.
+            base_meta = frame_metadata(self._mmc)
+
+            logger.info("Arming camera for %d images.", self.total_images)
+            self._mmc.startSequenceAcquisition(self.hw.camera_a_label, self.total_images, 0, True)
+            if not trigger_spim_scan_acquisition(self._mmc, self.hw):
+                # Without the scan no trigger ever arrives; do not wait on the camera.
+                logger.error("SPIM scan trigger failed; stopping the camera sequence.")
+                if self._mmc.isSequenceRunning(self.hw.camera_a_label):
+                    self._mmc.stopSequenceAcquisition(self.hw.camera_a_label)
+                return
+            logger.info("Acquisition thread now polling for frames.")
+
+            collected = 0
+            # Checked once; the level does not change mid-acquisition in practice.
+            log_frames = logger.isEnabledFor(logging.DEBUG)
+
+            while collected < self.total_images:
+                remaining = self._wait_for_images()
                 if not self._running:
                     logger.info("Acquisition stopped by user.")
                     break
-
-                while self._mmc.getRemainingImageCount() == 0:
-                    if not self._mmc.isSequenceRunning():
-                        logger.error("Camera sequence stopped unexpectedly.")
-                        break
-                    time.sleep(0.001)
-
-                if not self._mmc.isSequenceRunning() and self._mmc.getRemainingImageCount() == 0:
+                if remaining == 0:
+                    logger.error("Camera sequence stopped unexpectedly.")
                     break
 
-                tagged_img = self._mmc.popNextTaggedImage()
-                if tagged_img is None:
-                    logger.warning("Popped a null image, continuing.")
-                    continue
-
-                event = next(events)
-                meta = frame_metadata(self._mmc, mda_event=event)
-                self.frameReady.emit(tagged_img.pix, event, meta)
-                logger.debug("Frame collected: %s", event.index)
+                # Drain every image already in the buffer, then hand them over
+                # in one cross-thread emit instead of one per frame.
+                batch = []
+                for _ in range(min(remaining, self.total_images - collected)):
+                    collected += 1
+                    tagged_img = self._mmc.popNextTaggedImage()
+                    if tagged_img is None:
+                        logger.warning("Popped a null image, continuing.")
+                        continue
+
+                    event = next(events)
+                    meta = {**base_meta, "mda_event": event}
+                    batch.append((tagged_img.pix, event, meta, next(slots)))
+                    if log_frames:
+                        logger.debug("Frame collected: %s", event.index)
+                if batch:
+                    self.framesReady.emit(batch)
 
         except Exception as _:
             logger.critical("Acquisition loop failed due to an unexpected error.", exc_info=True)
         finally:
             self.acquisitionFinished.emit(self.sequence)
-            logger.info("Acquisition worker finished.")
+            logger.info("Acquisition thread finished.")
@@ -7,10 +7,9 @@ This isolates the complex MDA setup logic from the main application controller.
 
 import json
 import logging
-from collections import defaultdict
 from collections.abc import Mapping
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TextIO
 
 import numpy as np
 from pymmcore_plus import CMMCorePlus
@@ -34,6 +33,8 @@ logger = logging.getLogger(__name__)
 TIFF_EXTENSIONS = {".tif", ".tiff", ".ome.tif", ".ome.tiff"}
 ZARR_EXTENSIONS = {".zarr", ".ome.zarr"}
 AnyWriter = OMETiffWriter | OMEZarrWriter | ImageSequenceWriter
+# Flush the per-frame metadata file this often, so a crash loses at most this many lines.
+_META_FLUSH_EVERY = 64
 
 
 class OMETiffWriterWithMetadata(OMETiffWriter):
@@ -42,7 +43,9 @@ class OMETiffWriterWithMetadata(OMETiffWriter):
     def __init__(self, filename: str) -> None:
         super().__init__(filename)
         self._basename = Path(filename).with_suffix("").name
-        self.frame_metadatas: defaultdict[str, list[FrameMetaV1]] = defaultdict(list)
+        # Per-frame metadata is streamed here as JSON lines rather than held in memory.
+        self._meta_file: TextIO | None = None
+        self._meta_lines = 0
 
     def sequenceStarted(self, seq: MDASequence, meta: object = object()) -> None:
         super().sequenceStarted(seq, meta)
@@ -50,6 +53,10 @@ class OMETiffWriterWithMetadata(OMETiffWriter):
         self._meta_dir.mkdir(parents=True, exist_ok=True)
         seq_path = self._meta_dir / f"{self._basename}_useq_MDASequence.json"
         seq_path.write_text(seq.model_dump_json(indent=2))
+        self._close_meta_file()
+        meta_path = self._meta_dir / f"{self._basename}_frame_metadata.jsonl"
+        self._meta_file = meta_path.open("w")
+        self._meta_lines = 0
 
     @Slot(object, MDAEvent, dict)
     def frameReady(self, frame: np.ndarray, event: MDAEvent, meta: dict) -> None:
@@ -57,19 +64,25 @@ class OMETiffWriterWithMetadata(OMETiffWriter):
         meta_v1 = FrameMetaV1(**meta)
         super().frameReady(frame, event, meta_v1)
 
-        # Store the same object in our local metadata list.
-        key = str(event.index.get("p", 0))
-        self.frame_metadatas[key].append(meta_v1)
+    def store_frame_metadata(self, key: str, event: MDAEvent, meta: FrameMetaV1) -> None:
+        """Append one JSON line per frame instead of holding it in memory like the base class."""
+        if self._meta_file is None:
+            return
+        record = {"key": key, "p": str(event.index.get("p", 0)), "meta": to_builtins(meta)}
+        self._meta_file.write(json.dumps(record) + "\n")
+        self._meta_lines += 1
+        if self._meta_lines % _META_FLUSH_EVERY == 0:
+            self._meta_file.flush()
 
     def sequenceFinished(self, seq: MDASequence) -> None:
         super().sequenceFinished(seq)
-        if not self.frame_metadatas:
-            return
-        serializable_meta = {
-            pos_key: [to_builtins(m) for m in metas] for pos_key, metas in self.frame_metadatas.items()
-        }
-        meta_path = self._meta_dir / f"{self._basename}_frame_metadata.json"
-        meta_path.write_text(json.dumps(serializable_meta, indent=2))
+        self._close_meta_file()
+
+    def _close_meta_file(self) -> None:
+        """Flush and close the per-frame metadata file, if one is open."""
+        if self._meta_file is not None:
+            self._meta_file.close()
+            self._meta_file = None
 
 
 def _create_mda_handler(save_info: Mapping[str, Any]) -> AnyWriter | None:
@@ -127,4 +140,12 @@ def setup_mda_widget(
     else:
         logger.error("MDA widget does not have 'execute_mda' attribute.")
 
+    # The widget's Cancel goes to mmc.mda.cancel(), which is a no-op here because
+    # the PLogic run bypasses the runner; stop the acquisition thread as well.
+    control_btns = getattr(mda_widget, "control_btns", None)
+    if control_btns is not None and hasattr(control_btns, "cancel_btn"):
+        control_btns.cancel_btn.released.connect(engine.cancel)
+    else:
+        logger.warning("MDA widget has no cancel button; PLogic runs cannot be cancelled.")
+
     return engine
@@ -8,6 +8,7 @@ import logging
 from typing import Any
 
 from pymmcore_plus import CMMCorePlus
+from qtpy.QtCore import QTimer
 
 from microscope.acquisition import PLogicMDAEngine
 from microscope.application import setup_mda_widget
@@ -23,6 +24,11 @@ from .action_interceptor import ActionInterceptor
 
 logger = logging.getLogger(__name__)
 
+# Minimum time between scrub redraws; slider moves in between are coalesced.
+SCRUB_REFRESH_MS = 33
+# How long exit waits for a cancelled acquisition thread to leave the core.
+ACQUISITION_STOP_TIMEOUT_MS = 2000
+
 
 class ApplicationController:
     """
@@ -37,6 +43,14 @@ class ApplicationController:
 
         self.interceptor.override_actions()
         self.view = MainView()
+
+        # Slider moves only record the viewer; one redraw per interval shows the newest slice.
+        self._scrub_viewer: Any = None
+        self._scrub_timer = QTimer()
+        self._scrub_timer.setSingleShot(True)
+        self._scrub_timer.setInterval(SCRUB_REFRESH_MS)
+        self._scrub_timer.timeout.connect(self._flush_displayed_slice)
+
         self._setup_connections()
 
     def run(self) -> int:
@@ -47,6 +61,16 @@ class ApplicationController:
         """
         Initializes and connects all non-view components of the application.
         """
+        self._disconnect_faulty_snap_handler()
+        self._initialize_mda_engine()
+        self._connect_signals()
+        # Serial hardware setup runs on the first event-loop tick, after the
+        # window has been shown, so it does not delay the first paint.
+        QTimer.singleShot(0, self._on_event_loop_started)
+        logger.info("Application setup complete.")
+
+    def _on_event_loop_started(self) -> None:
+        """Runs the deferred hardware initialization once the window is up."""
         if not self._initialize_hardware():
             logger.critical("Hardware initialization failed.")
 
@@ -54,11 +78,6 @@ class ApplicationController:
         logger.info("Enabling SPIM beam for the session.")
         set_property(self.mmc, self.model.galvo_a_label, "BeamEnabled", "Yes")
 
-        self._disconnect_faulty_snap_handler()
-        self._initialize_mda_engine()
-        self._connect_signals()
-        logger.info("Application setup complete.")
-
     def _disconnect_faulty_snap_handler(self) -> None:
         """
         Disconnect the image preview's snap handler to prevent the race condition.
@@ -102,6 +121,9 @@ class ApplicationController:
 
     def _on_viewer_created(self, viewer: Any) -> None:
         """Once the viewer is created, connect its sliders to our handler."""
+        if self.engine:
+            # Only buffer frames for scrubbing once there is a viewer to scrub in.
+            self.engine.scrubbing_enabled = True
         if hasattr(viewer, "t_slider") and viewer.t_slider:
             viewer.t_slider.valueChanged.connect(functools.partial(self._on_slider_moved, viewer))
         if hasattr(viewer, "z_slider") and viewer.z_slider:
@@ -112,9 +134,18 @@ class ApplicationController:
             pass
 
     def _on_slider_moved(self, viewer: Any) -> None:
-        """Handle slider movements to update the displayed slice."""
+        """Handle slider movements by scheduling a coalesced display update."""
         if not self.engine:
             return
+        self._scrub_viewer = viewer
+        if not self._scrub_timer.isActive():
+            self._scrub_timer.start()
+
+    def _flush_displayed_slice(self) -> None:
+        """Display the slice the sliders point at now, dropping intermediate moves."""
+        viewer, self._scrub_viewer = self._scrub_viewer, None
+        if not self.engine or viewer is None:
+            return
         t_val = viewer.t_slider.value() if hasattr(viewer, "t_slider") and viewer.t_slider else 0
         z_val = viewer.z_slider.value() if hasattr(viewer, "z_slider") and viewer.z_slider else 0
         self.engine.set_displayed_slice(t_val, z_val)
@@ -122,7 +153,23 @@ class ApplicationController:
     def _on_exit(self) -> None:
         """Clean up hardware state and restore actions on application exit."""
         logger.info("Application closing. Cleaning up hardware.")
-        set_property(self.mmc, self.model.galvo_a_label, "BeamEnabled", "No")
-        close_global_shutter(self.mmc, self.model)
-        self.interceptor.restore_actions()
+        try:
+            # The acquisition thread polls the core; it must exit before devices unload.
+            if self.engine:
+                self.engine.cancel()
+                if not self.engine.wait_for_acquisition(ACQUISITION_STOP_TIMEOUT_MS):
+                    logger.error("Acquisition thread did not stop within %d ms.", ACQUISITION_STOP_TIMEOUT_MS)
+            # Live mode or an interrupted hardware-timed run may still be streaming;
+            # a camera cannot unload mid-sequence.
+            if self.mmc.isSequenceRunning():
+                self.mmc.stopSequenceAcquisition()
+            if self.model.camera_a_label and self.mmc.isSequenceRunning(self.model.camera_a_label):
+                self.mmc.stopSequenceAcquisition(self.model.camera_a_label)
+            set_property(self.mmc, self.model.galvo_a_label, "BeamEnabled", "No")
+            close_global_shutter(self.mmc, self.model)
+        finally:
+            self.interceptor.restore_actions()
+            # Release the serial ports and camera handles even if the safe-state
+            # writes above failed, so the next launch does not find them busy.
+            self.mmc.unloadAllDevices()
         logger.info("Cleanup complete.")
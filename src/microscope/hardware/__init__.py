@@ -12,7 +12,13 @@ from .camera import (
 )
 
 # Import core utilities
-from .core import get_property, send_tiger_command, set_property
+from .core import (
+    enable_serial_low_latency,
+    get_property,
+    send_tiger_command,
+    send_tiger_commands,
+    set_property,
+)
 
 # Import Galvo functions
 from .galvo import (
@@ -38,6 +44,8 @@ __all__ = [
     "get_property",
     "set_property",
     "send_tiger_command",
+    "send_tiger_commands",
+    "enable_serial_low_latency",
     # PLogic
     "open_global_shutter",
     "close_global_shutter",
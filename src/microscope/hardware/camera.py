@@ -8,7 +8,7 @@ and preparing the camera for hardware-timed acquisitions.
 
 import logging
 
-from pymmcore_plus import CMMCorePlus
+from pymmcore_plus import CMMCorePlus, DeviceType
 
 from microscope.model.hardware_model import HardwareConstants
 
@@ -16,32 +16,60 @@ from microscope.model.hardware_model import HardwareConstants
 logger = logging.getLogger(__name__)
 
 
-def _set_camera_trigger_mode(mmc: CMMCorePlus, camera_label: str, mode: str) -> bool:
+def _get_allowed_trigger_modes(mmc: CMMCorePlus, camera_label: str) -> frozenset[str]:
     """
-    Sets the trigger mode for a single camera, performing all necessary checks.
+    Queries the trigger modes a camera supports, once.
 
     This is a low-level helper function.
 
     Args:
         mmc: The CMMCorePlus instance.
-        camera_label: The device label of the camera to configure.
-        mode: The desired trigger mode to set.
+        camera_label: The device label of the camera to query.
 
     Returns:
-        True if the mode was set successfully, False otherwise.
+        The allowed 'TriggerMode' values, or an empty set if the camera is not
+        loaded or has no 'TriggerMode' property.
     """
-    if camera_label not in mmc.getLoadedDevices():
+    # Filter to cameras on the C++ side instead of checking every loaded device.
+    if camera_label not in mmc.getLoadedDevicesOfType(DeviceType.CameraDevice):
         logger.warning(f"Camera '{camera_label}' not loaded, skipping.")
-        return False
+        return frozenset()
 
     if not mmc.hasProperty(camera_label, "TriggerMode"):
         logger.warning(f"Camera '{camera_label}' does not support 'TriggerMode'.")
+        return frozenset()
+
+    return frozenset(mmc.getAllowedPropertyValues(camera_label, "TriggerMode"))
+
+
+def _set_camera_trigger_mode(
+    mmc: CMMCorePlus,
+    camera_label: str,
+    mode: str,
+    allowed_modes: frozenset[str] | None = None,
+) -> bool:
+    """
+    Sets the trigger mode for a single camera, performing all necessary checks.
+
+    This is a low-level helper function.
+
+    Args:
+        mmc: The CMMCorePlus instance.
+        camera_label: The device label of the camera to configure.
+        mode: The desired trigger mode to set.
+        allowed_modes: The camera's allowed modes, if already queried.
+
+    Returns:
+        True if the mode was set successfully, False otherwise.
+    """
+    if allowed_modes is None:
+        allowed_modes = _get_allowed_trigger_modes(mmc, camera_label)
+    if not allowed_modes:
         return False
 
-    allowed_modes = mmc.getAllowedPropertyValues(camera_label, "TriggerMode")
     if mode not in allowed_modes:
         logger.warning(
-            f"Mode '{mode}' not supported by {camera_label}. Allowed modes: {list(allowed_modes)}",
+            f"Mode '{mode}' not supported by {camera_label}. Allowed modes: {sorted(allowed_modes)}",
         )
         return False
 
@@ -54,6 +82,19 @@ def _set_camera_trigger_mode(mmc: CMMCorePlus, camera_label: str, mode: str) ->
         return False
 
 
+def _set_first_supported_mode(
+    mmc: CMMCorePlus,
+    camera_label: str,
+    preferred_modes: tuple[str, ...],
+    allowed_modes: frozenset[str],
+) -> bool:
+    """Sets the first of `preferred_modes` that the camera supports and accepts."""
+    for mode in preferred_modes:
+        if mode in allowed_modes and _set_camera_trigger_mode(mmc, camera_label, mode, allowed_modes):
+            return True
+    return False
+
+
 def set_camera_for_hardware_trigger(
     mmc: CMMCorePlus,
     camera_label: str,
@@ -74,9 +115,9 @@ def set_camera_for_hardware_trigger(
         True if a suitable mode was successfully set, False otherwise.
     """
     logger.debug(f"Configuring {camera_label} for hardware-timed acquisition.")
-    for mode in preferred_modes:
-        if _set_camera_trigger_mode(mmc, camera_label, mode):
-            return True
+    allowed_modes = _get_allowed_trigger_modes(mmc, camera_label)
+    if _set_first_supported_mode(mmc, camera_label, preferred_modes, allowed_modes):
+        return True
 
     logger.error(
         f"Could not set a suitable trigger mode for {camera_label} from {preferred_modes}.",
@@ -111,21 +152,16 @@ def check_and_reset_camera_trigger_modes(
     camera_labels = [hw.camera_a_label, hw.camera_b_label]
 
     for camera_label in camera_labels:
-        # Attempt to set one of the specified external modes
-        was_set = False
-        for mode in external_modes:
-            # We only need to find one that works for the test
-            if _set_camera_trigger_mode(mmc, camera_label, mode):
-                was_set = True
-                break
-
-        if not was_set:
+        allowed_modes = _get_allowed_trigger_modes(mmc, camera_label)
+
+        # We only need to find one external mode that works for the test
+        if not _set_first_supported_mode(mmc, camera_label, external_modes, allowed_modes):
             logger.warning(f"Test failed: Could not set any of {external_modes} for {camera_label}.")
             results[camera_label] = False
             continue
 
         # If setting an external mode worked, revert to the safe/reset mode
-        if _set_camera_trigger_mode(mmc, camera_label, reset_mode):
+        if _set_camera_trigger_mode(mmc, camera_label, reset_mode, allowed_modes):
             logger.debug(f"Successfully tested and reset {camera_label}.")
             results[camera_label] = True
         else:
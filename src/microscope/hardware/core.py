@@ -7,6 +7,9 @@ and the ASI Tiger controller, used by all other hardware-specific modules.
 """
 
 import logging
+import os
+import struct
+import sys
 import time
 from collections.abc import Iterator
 from contextlib import contextmanager
@@ -21,6 +24,48 @@ if TYPE_CHECKING:
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Time given to the Tiger controller to process a command before the next one,
+# used when the hub's reply is unavailable or not in the ":A"/":N" format.
+_TIGER_SETTLE_S = 0.01
+
+# Linux `struct serial_struct` layout used to toggle ASYNC_LOW_LATENCY.
+_SERIAL_STRUCT_SIZE = 128  # Larger than the kernel struct; the ioctl copies only what it needs.
+_SERIAL_FLAGS_OFFSET = 16  # type, line, port, irq precede `int flags`.
+_ASYNC_LOW_LATENCY = 1 << 13
+
+# Cached MMCore lookups, keyed by core instance. Cleared on config reload.
+_loaded_devices: dict[int, frozenset[str]] = {}
+_prop_exists: dict[tuple[int, str, str], bool] = {}
+
+
+def invalidate_property_cache() -> None:
+    """
+    Clears the cached loaded-device and property-existence lookups.
+
+    Must be called whenever the set of loaded devices changes, e.g. after
+    a new system configuration is loaded.
+    """
+    _loaded_devices.clear()
+    _prop_exists.clear()
+    logger.debug("Device/property lookup cache cleared.")
+
+
+def _is_loaded(mmc: CMMCorePlus, device_label: str) -> bool:
+    """Returns whether a device is loaded, querying MMCore only once per config."""
+    devices = _loaded_devices.get(id(mmc))
+    if devices is None:
+        devices = _loaded_devices[id(mmc)] = frozenset(mmc.getLoadedDevices())
+    return device_label in devices
+
+
+def _has_property(mmc: CMMCorePlus, device_label: str, property_name: str) -> bool:
+    """Returns whether a device has a property, querying MMCore only once per config."""
+    key = (id(mmc), device_label, property_name)
+    exists = _prop_exists.get(key)
+    if exists is None:
+        exists = _prop_exists[key] = mmc.hasProperty(device_label, property_name)
+    return exists
+
 
 @contextmanager
 def tiger_command_batch(mmc: CMMCorePlus, hw: "HardwareConstants") -> Iterator[None]:
@@ -50,10 +95,10 @@ def get_property(mmc: CMMCorePlus, device_label: str, property_name: str) -> str
     """
     Safely gets a Micro-Manager device property value.
     """
-    if device_label not in mmc.getLoadedDevices():
+    if not _is_loaded(mmc, device_label):
         logger.warning(f"Device '{device_label}' not loaded; cannot get property.")
         return None
-    if not mmc.hasProperty(device_label, property_name):
+    if not _has_property(mmc, device_label, property_name):
         logger.warning(f"Property '{property_name}' not found on '{device_label}'.")
         return None
 
@@ -66,10 +111,10 @@ def set_property(mmc: CMMCorePlus, device_label: str, property_name: str, value:
     """
     Sets a Micro-Manager device property, checking for existence and changes.
     """
-    if device_label not in mmc.getLoadedDevices():
+    if not _is_loaded(mmc, device_label):
         logger.error(f"Device '{device_label}' not loaded; cannot set property.")
         return False
-    if not mmc.hasProperty(device_label, property_name):
+    if not _has_property(mmc, device_label, property_name):
         logger.error(f"Property '{property_name}' not found on '{device_label}'.")
         return False
 
@@ -87,20 +132,108 @@ def set_property(mmc: CMMCorePlus, device_label: str, property_name: str, value:
         return False
 
 
+def _wait_for_ack(mmc: CMMCorePlus, tiger_label: str) -> bool:
+    """
+    Checks the Tiger's reply to the single command just sent through the hub.
+
+    The hub reads the reply while handling the `SerialCommand` write, so it
+    is already in `SerialResponse`. An ":A" (ack) or ":N" (error) reply
+    returns at once; a reply in any other format, or a hub that does not
+    expose its response, falls back to the fixed settle delay.
+
+    Returns:
+        False if the Tiger reported an error, True otherwise.
+    """
+    if not _has_property(mmc, tiger_label, "SerialResponse"):
+        time.sleep(_TIGER_SETTLE_S)
+        return True
+
+    response = mmc.getProperty(tiger_label, "SerialResponse")
+    if response.startswith(":A"):
+        return True
+    if response.startswith(":N"):
+        logger.warning(f"Tiger reported an error for the last command: {response}")
+        return False
+    logger.debug(f"Unrecognized Tiger reply '{response}'; waiting the settle delay.")
+    time.sleep(_TIGER_SETTLE_S)
+    return True
+
+
 def send_tiger_command(mmc: CMMCorePlus, cmd: str, hw: "HardwareConstants") -> bool:
     """
     Sends a serial command to the TigerCommHub device.
     """
     tiger_label = hw.tiger_comm_hub_label
-    if tiger_label not in mmc.getLoadedDevices():
+    if not _is_loaded(mmc, tiger_label):
         logger.error(f"Device '{tiger_label}' not loaded. Cannot send command: {cmd}")
         return False
 
     try:
         mmc.setProperty(tiger_label, "SerialCommand", cmd)
         logger.debug(f"Tiger command sent: {cmd}")
-        time.sleep(0.01)
-        return True
+        return _wait_for_ack(mmc, tiger_label)
     except Exception as e:
         logger.error(f"Failed to send Tiger command: {cmd} - {e}", exc_info=True)
         return False
+
+
+def send_tiger_commands(mmc: CMMCorePlus, cmds: list[str], hw: "HardwareConstants") -> bool:
+    """
+    Sends several serial commands to the TigerCommHub, one write per command.
+
+    The hub reads exactly one reply per `SerialCommand` write, so each
+    command is sent and acknowledged on its own; this keeps no stale replies
+    on the port for the next adapter query. Stops at the first command that
+    fails. Use inside `tiger_command_batch` so repeated payloads are not
+    suppressed by the hub.
+    """
+    for cmd in cmds:
+        if not send_tiger_command(mmc, cmd, hw):
+            logger.error(f"Tiger command batch stopped at '{cmd}'.")
+            return False
+    return True
+
+
+def enable_serial_low_latency(mmc: CMMCorePlus, hw: "HardwareConstants") -> bool:
+    """
+    Puts the Tiger's USB-serial port into low-latency mode on Linux.
+
+    USB-serial adapters (e.g. FTDI) default to a 16 ms latency timer, which
+    is paid on every Tiger command response. Setting ASYNC_LOW_LATENCY on the
+    port (the equivalent of `setserial <port> low_latency`) reduces this to
+    about 1 ms.
+
+    This is a best-effort optimization: failures are logged and the function
+    still returns True so that hardware initialization can proceed.
+    """
+    if not sys.platform.startswith("linux"):
+        logger.debug("Serial low-latency mode is only configured on Linux.")
+        return True
+
+    port = get_property(mmc, hw.tiger_comm_hub_label, "Port")
+    if not port or not port.startswith("/dev/"):
+        logger.debug(f"Tiger port '{port}' is not a local tty; skipping low-latency setup.")
+        return True
+
+    try:
+        import fcntl
+        import termios
+
+        fd = os.open(port, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        try:
+            buf = bytearray(_SERIAL_STRUCT_SIZE)
+            fcntl.ioctl(fd, termios.TIOCGSERIAL, buf)
+            (flags,) = struct.unpack_from("i", buf, _SERIAL_FLAGS_OFFSET)
+            if flags & _ASYNC_LOW_LATENCY:
+                logger.debug(f"Serial port {port} is already in low-latency mode.")
+                return True
+            struct.pack_into("i", buf, _SERIAL_FLAGS_OFFSET, flags | _ASYNC_LOW_LATENCY)
+            fcntl.ioctl(fd, termios.TIOCSSERIAL, buf)
+        finally:
+            os.close(fd)
+    except (ImportError, AttributeError, OSError) as e:
+        logger.warning(f"Could not enable low-latency mode on {port}: {e}")
+        return True
+
+    logger.info(f"Enabled low-latency mode on Tiger serial port {port}.")
+    return True
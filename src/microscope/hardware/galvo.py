@@ -17,6 +17,71 @@ from .core import get_property, set_property
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# (core id, galvo label) pairs whose static SPIM parameters have been written.
+_configured: set[tuple[int, str]] = set()
+
+
+def invalidate_galvo_static_config() -> None:
+    """Forces the static SPIM parameters to be rewritten on the next scan setup."""
+    _configured.clear()
+
+
+def watch_galvo_static_params(mmc: CMMCorePlus, hw: HardwareConstants) -> None:
+    """
+    Rewrites the static SPIM parameters after any of them changes elsewhere.
+
+    A static parameter can be changed outside a scan setup, e.g. by the
+    controller toggling BeamEnabled or a user editing a property in the
+    property browser. The next scan setup must then restore it, so such a
+    change drops the once-per-core record for that galvo.
+
+    Args:
+        mmc: The CMMCorePlus instance.
+        hw: The hardware constants object.
+    """
+    galvo_label = hw.galvo_a_label
+    static_props = frozenset(hw.galvo_static_params)
+    key = (id(mmc), galvo_label)
+
+    def _on_property_changed(device: str, prop: str, value: str) -> None:
+        if device == galvo_label and prop in static_props and key in _configured:
+            _configured.discard(key)
+            logger.debug(f"{galvo_label}.{prop} changed to '{value}'; static SPIM parameters will be rewritten.")
+
+    mmc.events.propertyChanged.connect(_on_property_changed)
+
+
+def _ensure_static_config(mmc: CMMCorePlus, hw: HardwareConstants) -> bool:
+    """
+    Writes the static galvo parameters from the config file once per core.
+
+    These properties do not change between acquisitions, so they are only
+    sent the first time a given core/galvo pair is configured, or again after
+    `watch_galvo_static_params` saw one of them change.
+
+    Args:
+        mmc: The CMMCorePlus instance.
+        hw: The hardware constants object.
+
+    Returns:
+        True if the static parameters are in place, False otherwise.
+    """
+    galvo_label = hw.galvo_a_label
+    key = (id(mmc), galvo_label)
+    if key in _configured:
+        return True
+
+    for prop, value in hw.galvo_static_params.items():
+        if not set_property(mmc, galvo_label, prop, value):
+            logger.error(
+                f"Failed to configure {galvo_label}. Could not set property '{prop}' to '{value}'.",
+            )
+            return False
+
+    _configured.add(key)
+    logger.debug(f"Static SPIM parameters written to {galvo_label}.")
+    return True
+
 
 def configure_galvo_for_spim_scan(
     mmc: CMMCorePlus,
@@ -41,18 +106,17 @@ def configure_galvo_for_spim_scan(
     galvo_label = hw.galvo_a_label
     logger.info(f"Configuring {galvo_label} for SPIM scan...")
 
-    # Start with the static parameters loaded from the config file.
-    params = hw.galvo_static_params.copy()
-
-    # Add dynamic and timing parameters.
-    params.update(
-        {
-            "SPIMNumRepeats": num_repeats,
-            "SPIMDelayBeforeRepeat(ms)": repeat_delay_ms,
-            "SingleAxisYAmplitude(deg)": settings.galvo_amplitude_deg,
-            "SPIMNumSlices": settings.num_slices,
-        }
-    )
+    # The static parameters from the config file only need to be sent once.
+    if not _ensure_static_config(mmc, hw):
+        return False
+
+    # Dynamic and timing parameters change with every sequence.
+    params = {
+        "SPIMNumRepeats": num_repeats,
+        "SPIMDelayBeforeRepeat(ms)": repeat_delay_ms,
+        "SingleAxisYAmplitude(deg)": settings.galvo_amplitude_deg,
+        "SPIMNumSlices": settings.num_slices,
+    }
 
     # Atomically apply all properties; fail if any single one fails.
     for prop, value in params.items():
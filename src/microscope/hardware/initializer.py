@@ -10,6 +10,8 @@ from pymmcore_plus import CMMCorePlus
 
 from ..model.hardware_model import HardwareConstants
 from .camera import check_and_reset_camera_trigger_modes
+from .core import enable_serial_low_latency, invalidate_property_cache
+from .galvo import invalidate_galvo_static_config, watch_galvo_static_params
 from .plogic import open_global_shutter
 
 logger = logging.getLogger(__name__)
@@ -48,9 +50,18 @@ def initialize_system_hardware(mmc: CMMCorePlus, hw: HardwareConstants) -> bool:
     """
     logger.debug("Performing one-time system hardware initialization...")
 
+    # Start from clean caches and drop them whenever a new config is loaded.
+    invalidate_property_cache()
+    invalidate_galvo_static_config()
+    mmc.events.systemConfigurationLoaded.connect(invalidate_property_cache)
+    mmc.events.systemConfigurationLoaded.connect(invalidate_galvo_static_config)
+    # Static galvo parameters changed outside a scan setup must be restored by the next one.
+    watch_galvo_static_params(mmc, hw)
+
     # A list of (name, function) tuples makes logging clear and is extensible.
     # All functions in the list must match the signature: (mmc, hw) -> bool.
     initialization_steps: list[tuple[str, Callable[[CMMCorePlus, HardwareConstants], bool]]] = [
+        ("Enabling Tiger serial low-latency mode", enable_serial_low_latency),
         ("Opening global shutter", open_global_shutter),
         ("Verifying camera trigger modes", _check_all_camera_triggers),
     ]
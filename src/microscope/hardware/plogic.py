@@ -12,7 +12,7 @@ from pymmcore_plus import CMMCorePlus
 
 from microscope.model.hardware_model import AcquisitionSettings, HardwareConstants
 
-from .core import send_tiger_command, tiger_command_batch
+from .core import send_tiger_command, send_tiger_commands, tiger_command_batch
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -35,10 +35,9 @@ def open_global_shutter(mmc: CMMCorePlus, hw: HardwareConstants) -> bool:
     ]
 
     with tiger_command_batch(mmc, hw):
-        for cmd in commands:
-            if not send_tiger_command(mmc, cmd, hw):
-                logger.error(f"Failed to send command to open shutter: {cmd}")
-                return False
+        if not send_tiger_commands(mmc, commands, hw):
+            logger.error("Failed to send commands to open shutter.")
+            return False
 
     logger.info("Global shutter is open (BNC3 is HIGH).")
     return True
@@ -61,10 +60,9 @@ def close_global_shutter(mmc: CMMCorePlus, hw: HardwareConstants) -> bool:
     ]
 
     with tiger_command_batch(mmc, hw):
-        for cmd in commands:
-            if not send_tiger_command(mmc, cmd, hw):
-                logger.error(f"Failed to send command to close shutter: {cmd}")
-                return False
+        if not send_tiger_commands(mmc, commands, hw):
+            logger.error("Failed to send commands to close shutter.")
+            return False
 
     logger.info("Global shutter is closed (BNC3 is LOW).")
     return True
@@ -82,20 +80,21 @@ def configure_plogic_for_dual_nrt_pulses(
     cam_cycles = int(settings.camera_exposure_ms * hw.pulses_per_ms)
     laser_cycles = int(settings.laser_trig_duration_ms * hw.pulses_per_ms)
 
+    commands = [
+        f"{plogic_addr}CCA X={hw.plogic_laser_preset_num}",
+        f"M E={hw.plogic_camera_cell}",
+        f"{plogic_addr}CCA Y=14 Z={cam_cycles}",
+        routing_str,
+        f"M E={hw.plogic_laser_on_cell}",
+        f"{plogic_addr}CCA Y=14 Z={laser_cycles}",
+        routing_str,
+        f"M E={hw.plogic_bnc1_addr}",
+        f"{plogic_addr}CCA Z={hw.plogic_camera_cell}",
+        f"{plogic_addr}SS Z",
+    ]
+
     with tiger_command_batch(mmc, hw):
-        commands_ok = (
-            send_tiger_command(mmc, f"{plogic_addr}CCA X={hw.plogic_laser_preset_num}", hw)
-            and send_tiger_command(mmc, f"M E={hw.plogic_camera_cell}", hw)
-            and send_tiger_command(mmc, f"{plogic_addr}CCA Y=14 Z={cam_cycles}", hw)
-            and send_tiger_command(mmc, routing_str, hw)
-            and send_tiger_command(mmc, f"M E={hw.plogic_laser_on_cell}", hw)
-            and send_tiger_command(mmc, f"{plogic_addr}CCA Y=14 Z={laser_cycles}", hw)
-            and send_tiger_command(mmc, routing_str, hw)
-            and send_tiger_command(mmc, f"M E={hw.plogic_bnc1_addr}", hw)
-            and send_tiger_command(mmc, f"{plogic_addr}CCA Z={hw.plogic_camera_cell}", hw)
-            and send_tiger_command(mmc, f"{plogic_addr}SS Z", hw)
-        )
-        if not commands_ok:
+        if not send_tiger_commands(mmc, commands, hw):
             logger.error("A command failed during PLogic configuration.")
             return False
 
@@ -116,11 +115,8 @@ def enable_live_laser(mmc: CMMCorePlus, hw: HardwareConstants) -> bool:
     live_cmd = f"{plogic_addr_prefix}CCA X={hw.plogic_live_mode_preset}"
 
     with tiger_command_batch(mmc, hw):
-        if not send_tiger_command(mmc, arm_cmd, hw):
-            logger.error("Failed to send laser arm command: %s", arm_cmd)
-            return False
-        if not send_tiger_command(mmc, live_cmd, hw):
-            logger.error("Failed to send live mode command: %s", live_cmd)
+        if not send_tiger_commands(mmc, [arm_cmd, live_cmd], hw):
+            logger.error("Failed to send laser arm/live mode commands: %s, %s", arm_cmd, live_cmd)
             return False
     return True
 
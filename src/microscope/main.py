@@ -7,8 +7,7 @@ import sys
 from pathlib import Path
 from typing import NoReturn
 
-from microscope.controller.application_controller import ApplicationController
-from microscope.model.hardware_model import HardwareConstants
+DEFAULT_CONFIG_PATH = Path("hardware_profiles/default_config.yml")
 
 
 def _setup_logging(loglevel: str) -> None:
@@ -44,7 +43,7 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--config",
         type=Path,
-        default="hardware_profiles/default_config.yml",
+        default=DEFAULT_CONFIG_PATH,
         help="Path to the YAML configuration file.",
     )
     parser.add_argument(
@@ -68,8 +67,16 @@ def main() -> NoReturn:
     logger.info("Application starting with config: %s", args.config)
     logger.debug("Debug logging is enabled.")
 
+    # Imported here rather than at module level so that `--help` and argument
+    # errors return before any application or third-party modules are loaded.
+    from microscope.model.hardware_model import HardwareConstants
+
     try:
         hw_constants = HardwareConstants(config_path=args.config)
+        # Deferred: pulls in the full Qt/pymmcore-gui stack, which config
+        # errors should not have to pay for.
+        from microscope.controller.application_controller import ApplicationController
+
         controller = ApplicationController(hw_constants)
         # controller.run() starts the Qt event loop and returns an exit code.
         exit_code = controller.run()
@@ -17,7 +17,7 @@ logger = logging.getLogger(__name__)
 __all__ = ["AcquisitionSettings", "HardwareConstants"]
 
 
-@dataclass
+@dataclass(slots=True)
 class AcquisitionSettings:
     """
     Stores all user-configurable acquisition parameters used by the ASI PLogic system.
@@ -80,9 +80,22 @@ class HardwareConstants:
     # --- Galvo/SPIM Static Settings ---
     galvo_static_params: dict[str, Any] = field(default_factory=dict)
 
+    # --- Acquisition Thread ---
+    # CPU the acquisition thread is pinned to on Linux when MICROSCOPE_PIN_ACQUISITION_THREAD is set.
+    acquisition_cpu_core: int = 0
+
+    # --- Display ---
+    # Keep acquired frames for t/z scrubbing; the GUI turns this on once a viewer exists.
+    enable_scrubbing: bool = False
+    # Directory for the scrub pixel spill file. Must be on a real disk, not a
+    # RAM-backed tmpfs; empty uses ~/.cache/microscope-control.
+    scrub_spill_dir: str = ""
+
     def __post_init__(self):
         """Load configuration from the YAML file after initialization."""
-        if not self.config_path.exists():
+        # Resolve once so logs and later comparisons see one canonical path.
+        self.config_path = Path(self.config_path).resolve()
+        if not self.config_path.is_file():
             logger.error(f"Config file not found: {self.config_path}")
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
 
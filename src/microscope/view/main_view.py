@@ -15,6 +15,7 @@ from typing import Any, cast
 from pymmcore_gui import WidgetAction, create_mmgui
 from pymmcore_gui._main_window import MicroManagerGUI
 from pymmcore_widgets.mda import MDAWidget
+from qtpy.QtCore import Qt
 from qtpy.QtWidgets import QApplication
 
 logger = logging.getLogger(__name__)
@@ -32,6 +33,10 @@ class MainView:
     def __init__(self) -> None:
         """Initializes the main window and application instance."""
         logger.info("Creating main GUI window.")
+        # Must be set before the QApplication exists: lets the OpenGL-backed
+        # image viewers share one GL context instead of creating their own.
+        if QApplication.instance() is None:
+            QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts, True)
         # Let create_mmgui handle the creation of the QApplication instance.
         self.window: MicroManagerGUI = create_mmgui(exec_app=False)
         # We must cast the instance() result to the more specific QApplication